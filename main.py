@@ -1,102 +1,240 @@
 import streamlit as st
-import requests
-from langchain.llms import OpenAI
-from langchain.chains import LLMChain
-from langchain.prompts import PromptTemplate
-from langchain.chat_models import ChatOpenAI
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import aiohttp
+import asyncio
+import hashlib
+import ijson
+import io
 import json
+import sqlite3
+import subprocess
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import re
 
 class GitHubRepoExtractor:
     def __init__(self):
         self.base_url = "https://api.github.com"
-        
+        # Reuse one session so keep-alive connections survive across calls
+        # instead of paying a TLS handshake per request. The on-disk cache
+        # revalidates with If-None-Match, so repeat runs get cheap 304s that
+        # don't count against the GitHub rate limit.
+        self.session = requests_cache.CachedSession(
+            '.ghcache',
+            backend='sqlite',
+            cache_control=True,
+            expire_after=3600
+        )
+        self.session.headers.update({
+            'Accept': 'application/vnd.github.v3+json',
+            'User-Agent': 'ui-generator-agent'
+        })
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount("https://api.github.com", adapter)
+        self.session.mount("https://raw.githubusercontent.com", adapter)
+
+    @staticmethod
+    def _parse_repo_url(repo_url):
+        """Parse a GitHub URL into (owner, repo)"""
+        match = _REPO_URL_RE.search(repo_url)
+        if not match:
+            raise ValueError(f"Not a valid GitHub repository URL: {repo_url}")
+        return match.group(1), match.group(2)
+
     def get_repo_contents(self, owner, repo, path=""):
         """Fetch repository contents from GitHub API"""
         url = f"{self.base_url}/repos/{owner}/{repo}/contents/{path}"
-        headers = {'Accept': 'application/vnd.github.v3+json'}
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url)
         if response.status_code != 200:
             raise Exception(f"GitHub API Error: {response.json().get('message', 'Unknown error')}")
         return response.json()
-    
+
+    def list_tree(self, owner, repo):
+        """List every file in the repository with a single Trees API call"""
+        response = self.session.get(f"{self.base_url}/repos/{owner}/{repo}")
+        if response.status_code != 200:
+            raise Exception(f"GitHub API Error: {response.json().get('message', 'Unknown error')}")
+        branch = response.json().get('default_branch', 'main')
+
+        url = f"{self.base_url}/repos/{owner}/{repo}/git/trees/{branch}?recursive=1"
+        response = self.session.get(url, stream=True)
+        if response.status_code != 200:
+            raise Exception(f"GitHub API Error: {response.json().get('message', 'Unknown error')}")
+
+        # Stream-parse the response: huge repos return tens of thousands of
+        # tree entries, and this keeps blobs-only filtering incremental
+        # instead of materializing the whole JSON document first
+        if getattr(response, 'from_cache', False):
+            # Cache hits are already fully in memory, and ijson's read(0)
+            # probe makes CachedHTTPResponse close its file pointer early —
+            # parse the buffered body instead
+            raw = io.BytesIO(response.content)
+        else:
+            raw = response.raw
+            if hasattr(raw, 'decode_content'):
+                raw.decode_content = True
+
+        files = []
+        truncated = False
+        entry_path = entry_type = None
+        for prefix, event, value in ijson.parse(raw):
+            if prefix == 'truncated' and event == 'boolean':
+                truncated = value
+            elif prefix == 'tree.item.path':
+                entry_path = value
+            elif prefix == 'tree.item.type':
+                entry_type = value
+            elif prefix == 'tree.item' and event == 'end_map':
+                if entry_type == 'blob':
+                    files.append({
+                        'path': entry_path,
+                        'name': entry_path.rsplit('/', 1)[-1],
+                        'download_url': f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{entry_path}"
+                    })
+                entry_path = entry_type = None
+        return files, truncated
+
     def get_file_content(self, download_url):
         """Fetch file content from GitHub"""
-        response = requests.get(download_url)
+        response = self.session.get(download_url)
         if response.status_code != 200:
             raise Exception(f"Failed to fetch file content: {response.status_code}")
         return response.text
     
+    async def _download_files(self, file_items):
+        """Download all file bodies concurrently on one aiohttp session"""
+        async def fetch(session, item):
+            try:
+                async with session.get(item['download_url']) as response:
+                    if response.status != 200:
+                        raise Exception(f"Failed to fetch file content: {response.status}")
+                    return item, await response.text()
+            except Exception as e:
+                return item, e
+
+        connector = aiohttp.TCPConnector(limit=32, limit_per_host=16)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return await asyncio.gather(*[fetch(session, item) for item in file_items])
+
     def extract_frontend_files(self, repo_url):
+        """Synchronous wrapper around extract_frontend_files_async for
+        callers outside an event loop"""
+        return asyncio.run(self.extract_frontend_files_async(repo_url))
+
+    async def extract_frontend_files_async(self, repo_url):
         """Extract frontend-related files from the repository"""
         try:
-            # Parse owner and repo from URL
-            parts = repo_url.split('github.com/')[-1].split('/')
-            owner, repo_name = parts[0], parts[1]
-            
+            owner, repo_name = self._parse_repo_url(repo_url)
+
             frontend_files = []
-            to_process = [("", [])]  # (path, files) tuples
-            processed_paths = set()
-            
-            # Frontend file extensions to look for
-            frontend_extensions = ('.html', '.css', '.js', '.jsx', '.tsx', '.vue', '.py')
-            
-            while to_process:
-                current_path, current_files = to_process.pop(0)
-                if current_path in processed_paths:
-                    continue
-                    
-                processed_paths.add(current_path)
-                
-                try:
-                    contents = self.get_repo_contents(owner, repo_name, current_path)
-                    
-                    # Handle both single file and directory responses
-                    if not isinstance(contents, list):
-                        contents = [contents]
-                    
-                    for item in contents:
-                        if item['type'] == 'dir':
-                            to_process.append((item['path'], []))
-                        elif item['type'] == 'file':
-                            if Path(item['name']).suffix in frontend_extensions:
-                                try:
-                                    file_content = self.get_file_content(item['download_url'])
-                                    frontend_files.append({
-                                        'path': item['path'],
-                                        'content': file_content,
-                                        'type': Path(item['name']).suffix
-                                    })
-                                    
-                                    # Progress update
-                                    st.sidebar.write(f"Found: {item['path']}")
-                                except Exception as e:
-                                    st.warning(f"Couldn't fetch content for {item['path']}: {str(e)}")
-                
-                except Exception as e:
-                    st.warning(f"Error processing {current_path}: {str(e)}")
+
+            # Phase 1: list the whole tree in one Trees API call instead of
+            # one /contents request per directory
+            try:
+                tree_items, truncated = self.list_tree(owner, repo_name)
+            except Exception as e:
+                st.warning(f"Tree listing failed, falling back to directory crawl: {str(e)}")
+                tree_items, truncated = None, True
+
+            if tree_items is not None and not truncated:
+                file_items = [
+                    item for item in tree_items
+                    if _is_frontend_file(item['name'])
+                    and not _in_ignored_dir(item['path'])
+                ]
+            else:
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    file_items = self._crawl_contents(executor, owner, repo_name)
+
+            # Phase 2: file bodies are independent, so download them all
+            # concurrently on the event loop
+            for item, file_content in await self._download_files(file_items):
+                if isinstance(file_content, Exception):
+                    st.warning(f"Couldn't fetch content for {item['path']}: {str(file_content)}")
                     continue
-            
+                frontend_files.append({
+                    'path': item['path'],
+                    'content': file_content,
+                    'type': _file_suffix(item['name'])
+                })
+
+                # Progress update
+                st.sidebar.write(f"Found: {item['path']}")
+
             if not frontend_files:
                 st.warning("No frontend files found in the repository")
                 return None
-            
+
             return frontend_files
-            
+
         except Exception as e:
             st.error(f"Error extracting repository: {str(e)}")
             return None
-    
+
+    def _crawl_contents(self, executor, owner, repo_name):
+        """Fallback crawl via /contents for repos whose tree listing is
+        truncated (GitHub caps recursive tree responses)"""
+        to_process = deque([""])  # directory paths still to list
+        processed_paths = set()
+
+        # Walk the tree level by level, listing sibling directories in
+        # parallel. Results are consumed on the main thread so Streamlit
+        # calls stay off the workers.
+        file_items = []
+        while to_process:
+            level = []
+            while to_process:
+                current_path = to_process.popleft()
+                if current_path in processed_paths:
+                    continue
+                processed_paths.add(current_path)
+                level.append(current_path)
+
+            def list_path(path):
+                try:
+                    return path, self.get_repo_contents(owner, repo_name, path)
+                except Exception as e:
+                    return path, e
+
+            for current_path, contents in executor.map(list_path, level):
+                if isinstance(contents, Exception):
+                    st.warning(f"Error processing {current_path}: {str(contents)}")
+                    continue
+
+                # Handle both single file and directory responses
+                if not isinstance(contents, list):
+                    contents = [contents]
+
+                for item in contents:
+                    if item['type'] == 'dir':
+                        if item['name'] in IGNORE_DIRS:
+                            continue
+                        to_process.append(item['path'])
+                    elif item['type'] == 'file':
+                        if _is_frontend_file(item['name']):
+                            file_items.append(item)
+
+        return file_items
+
     def get_repo_info(self, repo_url):
         """Get basic repository information"""
         try:
-            parts = repo_url.split('github.com/')[-1].split('/')
-            owner, repo_name = parts[0], parts[1]
-            
+            owner, repo_name = self._parse_repo_url(repo_url)
+
             url = f"{self.base_url}/repos/{owner}/{repo_name}"
-            headers = {'Accept': 'application/vnd.github.v3+json'}
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url)
             
             if response.status_code == 200:
                 repo_data = response.json()
@@ -115,67 +253,278 @@ class GitHubRepoExtractor:
             st.error(f"Error getting repository information: {str(e)}")
             return None
 
-class UIGenerator:
-    def __init__(self, openai_api_key):
-        self.llm = OpenAI(temperature=0.7, openai_api_key=openai_api_key)
-        self.chat_model = ChatOpenAI(
-            temperature=0.7,
-            openai_api_key=openai_api_key,
-            model_name="gpt-3.5-turbo"
-        )
-        
-    def generate_ui(self, frontend_files):
-        prompt_template = """You are an AI agent specialized in creating user interfaces.
-        
+class ExtractionError(Exception):
+    """Raised by the cached fetchers on an empty result. st.cache_data
+    doesn't memoize exceptions, so a transient GitHub failure isn't
+    pinned as a negative result for the whole TTL"""
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_frontend_files(repo_url):
+    """Memoized per repo_url so widget interactions don't re-crawl the repo
+    on every Streamlit rerun"""
+    files = GitHubRepoExtractor().extract_frontend_files(repo_url)
+    if not files:
+        raise ExtractionError(f"No frontend files extracted from {repo_url}")
+    return files
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_repo_info(repo_url):
+    """Memoized per repo_url across Streamlit reruns"""
+    info = GitHubRepoExtractor().get_repo_info(repo_url)
+    if not info:
+        raise ExtractionError(f"No repository information for {repo_url}")
+    return info
+
+# Frontend file extensions to look for
+FRONTEND_EXTS = frozenset({'.html', '.css', '.js', '.jsx', '.tsx', '.vue', '.py'})
+
+def _file_suffix(name):
+    """Extension of a file name, without a Path allocation per entry"""
+    dot = name.rfind('.')
+    return name[dot:] if dot != -1 else ''
+
+def _is_frontend_file(name):
+    """Frontend source file by extension; minified bundles are machine
+    output that wastes download time and prompt budget"""
+    if name.endswith(('.min.js', '.min.css')):
+        return False
+    return _file_suffix(name) in FRONTEND_EXTS
+
+# Vendored, generated and tooling directories that never hold hand-written
+# frontend code — skipping them prunes most of the walk on real repos
+IGNORE_DIRS = frozenset({
+    'node_modules', '.git', 'dist', 'build', '.venv', 'venv', '__pycache__',
+    '.next', '.nuxt', 'vendor', 'target', '.idea', '.vscode'
+})
+
+def _in_ignored_dir(path):
+    """True if any directory component of a repo path is on the ignore list"""
+    return any(part in IGNORE_DIRS for part in path.split('/')[:-1])
+
+# Accepts https URLs and git remotes, ignoring trailing slashes, .git
+# suffixes, query strings and fragments. Dots stay legal inside repo
+# names (next.js, socket.io); only a literal trailing .git is dropped.
+_REPO_URL_RE = re.compile(r'github\.com[:/]([^/]+?)/([^/?#\s]+?)(?:\.git)?(?:[/?#]|$)')
+
+# Compiled once; searched from the first fence so extraction skips the
+# prose prefix without rescanning it
+_CODE_RE = re.compile(r'```(?:python)?\n(.*?)\n```', re.DOTALL)
+
+UI_PROMPT_TEMPLATE = """You are an AI agent specialized in creating user interfaces.
+
         Repository files:
         {frontend_files}
-        
+
         Create a modern, responsive Streamlit UI for this repository that includes:
         1. A clean and professional layout
         2. Necessary input components and forms
         3. Data visualization sections if needed
         4. Interactive elements and navigation
         5. Error handling and user feedback
-        
+
         The UI should match the repository's functionality and purpose.
         Generate complete, runnable Streamlit code.
-        
+
         Important: Include all necessary imports and make sure the code is self-contained.
         Use modern Streamlit features like st.tabs(), st.columns(), etc.
         """
-        
-        prompt = PromptTemplate(
+
+class LLMCache:
+    """Exact-match cache for LLM completions, keyed on a SHA-256 of the
+    serialized request so identical prompts never hit the API twice"""
+
+    def __init__(self, path=".llmcache.sqlite"):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS completions (key TEXT PRIMARY KEY, response TEXT)"
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(model, prompt, temperature):
+        payload = json.dumps(
+            {"model": model, "prompt": prompt, "temperature": temperature},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key):
+        row = self.conn.execute(
+            "SELECT response FROM completions WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key, response):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO completions (key, response) VALUES (?, ?)",
+            (key, response)
+        )
+        self.conn.commit()
+
+class UIGenerator:
+    def __init__(self, openai_api_key):
+        # Imported lazily: LangChain pulls in pydantic, tiktoken, httpx and
+        # friends, which would otherwise dominate cold start for a page
+        # that may never reach the generation step
+        from langchain.llms import OpenAI
+        from langchain.chains import LLMChain
+        from langchain.chat_models import ChatOpenAI
+        from langchain.prompts import PromptTemplate
+
+        self.openai_api_key = openai_api_key
+        self.llm = OpenAI(temperature=0.7, openai_api_key=openai_api_key)
+        self.chat_model = ChatOpenAI(
+            temperature=0.7,
+            openai_api_key=openai_api_key,
+            model_name="gpt-3.5-turbo",
+            streaming=True
+        )
+        self.cache = LLMCache()
+        # Built once: PromptTemplate validation and LLMChain callback
+        # wiring don't need repeating per call
+        self._ui_prompt = PromptTemplate(
             input_variables=["frontend_files"],
-            template=prompt_template
+            template=UI_PROMPT_TEMPLATE
         )
-        
-        chain = LLMChain(llm=self.llm, prompt=prompt)
-        initial_code = chain.run(frontend_files=json.dumps(frontend_files, indent=2))
-        
+        self._ui_chain = LLMChain(llm=self.llm, prompt=self._ui_prompt)
+
+    # Entry-point style files carry the most signal about what the app does
+    PRIORITY_FILES = ('app.py', 'main.py', 'index.html', 'package.json')
+
+    @staticmethod
+    def _prepare_prompt_payload(frontend_files, max_total_chars=60000, max_file_chars=4000):
+        """Rank files by relevance and truncate bodies so large repos fit
+        the model's context window instead of overflowing it (and paying
+        for every extra token)"""
+        def rank(f):
+            name = f['path'].rsplit('/', 1)[-1]
+            try:
+                priority = UIGenerator.PRIORITY_FILES.index(name)
+            except ValueError:
+                priority = len(UIGenerator.PRIORITY_FILES)
+            return (priority, len(f['content']))
+
+        trimmed = []
+        total = 0
+        for f in sorted(frontend_files, key=rank):
+            content = f['content']
+            if len(content) > max_file_chars:
+                # Keep head and tail: imports/config up top, entry point at
+                # the bottom
+                head = content[:max_file_chars // 2]
+                tail = content[-(max_file_chars // 2):]
+                snipped = len(content) - max_file_chars
+                content = f"{head}\n/* ...snipped {snipped} bytes... */\n{tail}"
+            if total + len(content) > max_total_chars:
+                break
+            total += len(content)
+            trimmed.append({'path': f['path'], 'content': content, 'type': f['type']})
+        return json.dumps(trimmed, indent=2)
+
+    def generate_ui(self, frontend_files):
+        payload = self._prepare_prompt_payload(frontend_files)
+        cache_key = LLMCache.make_key(
+            "openai", self._ui_prompt.format(frontend_files=payload), 0.7
+        )
+        initial_code = self.cache.get(cache_key)
+        if initial_code is None:
+            initial_code = self._ui_chain.run(frontend_files=payload)
+            self.cache.set(cache_key, initial_code)
+
         return self.extract_code(initial_code)
+
+    def generate_ui_stream(self, frontend_files):
+        """Yield the UI completion incrementally for st.write_stream, so
+        tokens render as they arrive instead of after the full response"""
+        prompt_text = UI_PROMPT_TEMPLATE.format(
+            frontend_files=self._prepare_prompt_payload(frontend_files)
+        )
+        cache_key = LLMCache.make_key("gpt-3.5-turbo", prompt_text, 0.7)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        chunks = []
+        for chunk in self.chat_model.stream(prompt_text):
+            chunks.append(chunk.content)
+            yield chunk.content
+        self.cache.set(cache_key, "".join(chunks))
     
-    def improve_code(self, code, feedback):
-        """Improve code based on human feedback"""
-        prompt = f"""
+    @staticmethod
+    def _build_feedback_prompt(code, feedback):
+        return f"""
         Original Code:
         ```python
         {code}
         ```
-        
+
         Human Feedback:
         {feedback}
-        
+
         Please improve the code based on the feedback provided.
         Ensure the code is complete and ready to run.
         """
-        
-        response = self.chat_model.predict(prompt)
+
+    def improve_code(self, code, feedback):
+        """Improve code based on human feedback"""
+        return asyncio.run(self.improve_code_async(code, feedback))
+
+    async def improve_code_async(self, code, feedback):
+        """Async version of improve_code, so several improvement calls can
+        be gathered concurrently"""
+        prompt = self._build_feedback_prompt(code, feedback)
+        cache_key = LLMCache.make_key("gpt-3.5-turbo", prompt, 0.7)
+        response = self.cache.get(cache_key)
+        if response is None:
+            from openai import AsyncOpenAI
+
+            # Constructed per call on purpose: the generator outlives each
+            # asyncio.run loop (st.cache_resource), and a client kept across
+            # loops would hand out keep-alive connections bound to a closed
+            # one ("Event loop is closed")
+            async with AsyncOpenAI(api_key=self.openai_api_key) as client:
+                completion = await client.chat.completions.create(
+                    model="gpt-3.5-turbo",
+                    temperature=0.7,
+                    messages=[{"role": "user", "content": prompt}]
+                )
+            response = completion.choices[0].message.content
+            self.cache.set(cache_key, response)
         return self.extract_code(response)
+
+    def improve_code_variants(self, code, feedbacks):
+        """Run one improvement per feedback item concurrently; latency is
+        max() of the calls rather than their sum"""
+        async def run_all():
+            return await asyncio.gather(
+                *[self.improve_code_async(code, fb) for fb in feedbacks]
+            )
+        return asyncio.run(run_all())
     
     def extract_code(self, content):
-        code_match = re.search(r'```python\n(.*?)\n```', content, re.DOTALL)
+        # Prefer an explicit python fence so a leading ```json or similar
+        # block never shadows the code
+        start = content.find('```python')
+        if start == -1:
+            start = content.find('```')
+        if start == -1:
+            return content
+        code_match = _CODE_RE.search(content, start)
         return code_match.group(1) if code_match else content
 
+@st.cache_data
+def _load_css():
+    """Read the stylesheet once per process instead of on every rerun"""
+    css_path = Path(__file__).with_name('style.css')
+    return f"<style>{css_path.read_text()}</style>"
+
+@st.cache_resource
+def get_generator(api_key):
+    """One UIGenerator (and its underlying HTTP clients/connection pools)
+    per API key, reused across Streamlit reruns"""
+    return UIGenerator(api_key)
+
 def main():
     st.set_page_config(
         page_title="GitHub UI Generator",
@@ -185,28 +534,7 @@ def main():
     )
     
     # Custom CSS
-    st.markdown("""
-        <style>
-        .main {
-            padding: 2rem;
-        }
-        .stButton>button {
-            width: 100%;
-        }
-        .feedback-section {
-            margin-top: 1rem;
-            padding: 1rem;
-            border-radius: 0.5rem;
-            background-color: #f0f2f6;
-        }
-        .code-improvement {
-            margin-top: 1rem;
-            padding: 1rem;
-            border: 1px solid #e0e0e0;
-            border-radius: 0.5rem;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_load_css(), unsafe_allow_html=True)
     
     # Initialize session state
     if 'generated_code' not in st.session_state:
@@ -244,13 +572,20 @@ def main():
         if generate_button and repo_url and openai_api_key:
             with st.spinner("Analyzing repository and generating UI..."):
                 try:
-                    extractor = GitHubRepoExtractor()
-                    frontend_files = extractor.extract_frontend_files(repo_url)
-                    
+                    try:
+                        frontend_files = fetch_frontend_files(repo_url)
+                    except ExtractionError:
+                        frontend_files = None
+
                     if frontend_files:
-                        generator = UIGenerator(openai_api_key)
-                        generated_code = generator.generate_ui(frontend_files)
-                        st.session_state.generated_code = generated_code
+                        generator = get_generator(openai_api_key)
+                        placeholder = st.empty()
+                        with placeholder.container():
+                            full_response = st.write_stream(
+                                generator.generate_ui_stream(frontend_files)
+                            )
+                        placeholder.empty()
+                        st.session_state.generated_code = generator.extract_code(full_response)
                         st.session_state.current_version += 1
                         st.success("Initial UI generated! Please review and provide feedback.")
                     else:
@@ -317,7 +652,7 @@ def main():
                         st.session_state.feedback_history.append(feedback_entry)
                         
                         # Generate improved code
-                        generator = UIGenerator(openai_api_key)
+                        generator = get_generator(openai_api_key)
                         improved_code = generator.improve_code(
                             st.session_state.generated_code,
                             detailed_feedback
@@ -335,11 +670,25 @@ def main():
         with tabs[2]:
             st.warning("Preview functionality is limited for security reasons")
             if st.button("Try Preview"):
-                try:
-                    with st.spinner("Loading preview..."):
-                        exec(st.session_state.generated_code)
-                except Exception as e:
-                    st.error(f"Preview Error: {str(e)}")
+                # Run generated code in a child process with a timeout so it
+                # can't hang the worker or leak memory into this session
+                with st.spinner("Loading preview..."):
+                    try:
+                        result = subprocess.run(
+                            [sys.executable, '-c', st.session_state.generated_code],
+                            capture_output=True,
+                            text=True,
+                            timeout=10
+                        )
+                    except subprocess.TimeoutExpired:
+                        st.error("Preview timed out after 10 seconds")
+                    else:
+                        if result.stdout:
+                            st.code(result.stdout)
+                        if result.returncode != 0:
+                            st.error(f"Preview Error: {result.stderr}")
+                        elif result.stderr:
+                            st.text(result.stderr)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,11 +1,13 @@
 import streamlit as st
-import openai
-
-# Set API key
-openai.api_key = "your_openai_api_key_here"
 
 # Define function to handle chat with OpenAI
 def chat_with_openai(user_input):
+    # Import lazily so the first render only pays for streamlit
+    import openai
+
+    # Set API key
+    openai.api_key = "your_openai_api_key_here"
+
     # Create chat completion
     response = openai.ChatCompletion.create(
         model="gpt-3.5-turbo",